@@ -4,433 +4,453 @@ Registry Fix Script
 Fixes dead references and adds orphaned files to registry.json
 """
 
+import argparse
 import json
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional C parser/encoder; fall back to the stdlib
+    orjson = None
+
 REPO_ROOT = Path(__file__).parent.parent.parent
 REGISTRY_FILE = REPO_ROOT / "registry.json"
+SCAN_CACHE_FILE = REPO_ROOT / ".registry-fix-cache.json"
+SCAN_WORKERS = 8
+# Coarsest common filesystem timestamp granularity (FAT, some network mounts)
+MTIME_RESOLUTION_NS = 2_000_000_000
 
-def load_registry():
-    with open(REGISTRY_FILE, 'r') as f:
-        return json.load(f)
-
-def save_registry(registry):
-    with open(REGISTRY_FILE, 'w') as f:
-        json.dump(registry, f, indent=2)
-    print(f"✓ Registry saved to {REGISTRY_FILE}")
-
-def remove_dead_references(registry):
-    """Remove entries that point to non-existent files"""
-    dead_entries = [
-        "workflows-delegation",  # Split into multiple files
-        "design-iteration",      # Split into multiple files  
-        "design-assets",         # Doesn't exist
-        "animation-patterns",    # Split into animation-*.md files
-        "adding-agent",          # Split into adding-agent-*.md
-        "adding-skill",          # Split into adding-skill-*.md
-        "navigation-design",     # Split into navigation-design-*.md
-        "claude-agent-skills",   # Directory doesn't exist
-        "claude-create-subagents", # Directory doesn't exist
-        "claude-hooks",          # Directory doesn't exist
-        "claude-plugins",        # Directory doesn't exist
-        "external-libraries",    # Split into external-libraries-*.md
-        "navigation",            # Duplicate/to-be-consumed doesn't exist
-    ]
-    
-    removed = []
-    for category in ['contexts']:
-        if category in registry['components']:
-            original_count = len(registry['components'][category])
-            registry['components'][category] = [
-                c for c in registry['components'][category] 
-                if c['id'] not in dead_entries
-            ]
-            removed_count = original_count - len(registry['components'][category])
-            if removed_count > 0:
-                removed.append(f"{category}: {removed_count} entries")
-    
-    print(f"✓ Removed dead references: {', '.join(removed) if removed else 'None'}")
-    return registry
+# Context ids whose files were split or removed
+DEAD_ENTRIES = frozenset({
+    "workflows-delegation",  # Split into multiple files
+    "design-iteration",      # Split into multiple files
+    "design-assets",         # Doesn't exist
+    "animation-patterns",    # Split into animation-*.md files
+    "adding-agent",          # Split into adding-agent-*.md
+    "adding-skill",          # Split into adding-skill-*.md
+    "navigation-design",     # Split into navigation-design-*.md
+    "claude-agent-skills",   # Directory doesn't exist
+    "claude-create-subagents", # Directory doesn't exist
+    "claude-hooks",          # Directory doesn't exist
+    "claude-plugins",        # Directory doesn't exist
+    "external-libraries",    # Split into external-libraries-*.md
+    "navigation",            # Duplicate/to-be-consumed doesn't exist
+})
 
-def add_split_file_entries(registry):
-    """Add entries for split files that exist on disk"""
-    
-    new_entries = [
-        # Task Delegation (split files)
-        {
-            "id": "task-delegation-basics",
-            "name": "Task Delegation Basics",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/task-delegation-basics.md",
-            "description": "Task delegation fundamentals and basic usage patterns",
-            "tags": ["workflows", "delegation"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "task-delegation-specialists",
-            "name": "Task Delegation Specialists",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/task-delegation-specialists.md",
-            "description": "Specialist subagents for task delegation workflows",
-            "tags": ["workflows", "delegation", "subagents"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "task-delegation-caching",
-            "name": "Task Delegation Caching",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/task-delegation-caching.md",
-            "description": "Caching strategies for task delegation workflows",
-            "tags": ["workflows", "delegation", "caching"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        
-        # Design Iteration (split files)
-        {
-            "id": "design-iteration-overview",
-            "name": "Design Iteration Overview",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-overview.md",
-            "description": "Overview of the design iteration workflow process",
-            "tags": ["workflows", "design", "iteration"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-plan-file",
-            "name": "Design Iteration Plan File",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-plan-file.md",
-            "description": "Structure and format for design iteration plan files",
-            "tags": ["workflows", "design", "planning"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-plan-iterations",
-            "name": "Design Iteration Plan Iterations",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-plan-iterations.md",
-            "description": "Planning iterations in the design workflow",
-            "tags": ["workflows", "design", "planning"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-stage-layout",
-            "name": "Design Iteration Stage - Layout",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-stage-layout.md",
-            "description": "Layout stage guidelines for design iteration",
-            "tags": ["workflows", "design", "layout"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-stage-theme",
-            "name": "Design Iteration Stage - Theme",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-stage-theme.md",
-            "description": "Theme stage guidelines for design iteration",
-            "tags": ["workflows", "design", "theme"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-stage-implementation",
-            "name": "Design Iteration Stage - Implementation",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-stage-implementation.md",
-            "description": "Implementation stage guidelines for design iteration",
-            "tags": ["workflows", "design", "implementation"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-stage-animation",
-            "name": "Design Iteration Stage - Animation",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-stage-animation.md",
-            "description": "Animation stage guidelines for design iteration",
-            "tags": ["workflows", "design", "animation"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-visual-content",
-            "name": "Design Iteration Visual Content",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-visual-content.md",
-            "description": "Visual content guidelines for design iteration",
-            "tags": ["workflows", "design", "visual"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "design-iteration-best-practices",
-            "name": "Design Iteration Best Practices",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/design-iteration-best-practices.md",
-            "description": "Best practices for design iteration workflows",
-            "tags": ["workflows", "design", "best-practices"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        
-        # External Libraries (split files)
-        {
-            "id": "external-libraries-workflow",
-            "name": "External Libraries Workflow",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/external-libraries-workflow.md",
-            "description": "Workflow for managing external library dependencies",
-            "tags": ["workflows", "external", "libraries"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "external-libraries-scenarios",
-            "name": "External Libraries Scenarios",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/external-libraries-scenarios.md",
-            "description": "Common scenarios for external library integration",
-            "tags": ["workflows", "external", "libraries", "scenarios"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "external-libraries-faq",
-            "name": "External Libraries FAQ",
-            "type": "context",
-            "path": ".opencode/context/core/workflows/external-libraries-faq.md",
-            "description": "Frequently asked questions about external libraries",
-            "tags": ["workflows", "external", "libraries", "faq"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        
-        # Adding Agent (split files)
-        {
-            "id": "adding-agent-basics",
-            "name": "Adding Agent - Basics",
-            "type": "context",
-            "path": ".opencode/context/openagents-repo/guides/adding-agent-basics.md",
-            "description": "Basic guide for adding new agents",
-            "tags": ["guides", "agents", "basics"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "adding-agent-testing",
-            "name": "Adding Agent - Testing",
-            "type": "context",
-            "path": ".opencode/context/openagents-repo/guides/adding-agent-testing.md",
-            "description": "Testing guide for new agents",
-            "tags": ["guides", "agents", "testing"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        
-        # Adding Skill (split files)
-        {
-            "id": "adding-skill-basics",
-            "name": "Adding Skill - Basics",
-            "type": "context",
-            "path": ".opencode/context/openagents-repo/guides/adding-skill-basics.md",
-            "description": "Basic guide for adding new skills",
-            "tags": ["guides", "skills", "basics"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "adding-skill-implementation",
-            "name": "Adding Skill - Implementation",
-            "type": "context",
-            "path": ".opencode/context/openagents-repo/guides/adding-skill-implementation.md",
-            "description": "Implementation guide for new skills",
-            "tags": ["guides", "skills", "implementation"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "adding-skill-example",
-            "name": "Adding Skill - Example",
-            "type": "context",
-            "path": ".opencode/context/openagents-repo/guides/adding-skill-example.md",
-            "description": "Example of adding a new skill",
-            "tags": ["guides", "skills", "examples"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        
-        # Navigation Design (split files)
-        {
-            "id": "navigation-design-basics",
-            "name": "Navigation Design Basics",
-            "type": "context",
-            "path": ".opencode/context/core/context-system/guides/navigation-design-basics.md",
-            "description": "Basics of designing navigation files",
-            "tags": ["context-system", "navigation", "design"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "navigation-templates",
-            "name": "Navigation Templates",
-            "type": "context",
-            "path": ".opencode/context/core/context-system/guides/navigation-templates.md",
-            "description": "Templates for navigation files",
-            "tags": ["context-system", "navigation", "templates"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        
-        # Animation Patterns (split files)
-        {
-            "id": "animation-basics",
-            "name": "Animation Basics",
-            "type": "context",
-            "path": ".opencode/context/ui/web/animation-basics.md",
-            "description": "Basic animation patterns and guidelines",
-            "tags": ["ui", "web", "animation"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "animation-advanced",
-            "name": "Animation Advanced",
-            "type": "context",
-            "path": ".opencode/context/ui/web/animation-advanced.md",
-            "description": "Advanced animation patterns and techniques",
-            "tags": ["ui", "web", "animation"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "animation-components",
-            "name": "Animation Components",
-            "type": "context",
-            "path": ".opencode/context/ui/web/animation-components.md",
-            "description": "Component-specific animation patterns",
-            "tags": ["ui", "web", "animation", "components"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "animation-forms",
-            "name": "Animation Forms",
-            "type": "context",
-            "path": ".opencode/context/ui/web/animation-forms.md",
-            "description": "Animation patterns for forms",
-            "tags": ["ui", "web", "animation", "forms"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "animation-chat",
-            "name": "Animation Chat",
-            "type": "context",
-            "path": ".opencode/context/ui/web/animation-chat.md",
-            "description": "Animation patterns for chat interfaces",
-            "tags": ["ui", "web", "animation", "chat"],
-            "dependencies": [],
-            "category": "standard"
-        },
-        {
-            "id": "animation-loading",
-            "name": "Animation Loading",
-            "type": "context",
-            "path": ".opencode/context/ui/web/animation-loading.md",
-            "description": "Loading animation patterns",
-            "tags": ["ui", "web", "animation", "loading"],
-            "dependencies": [],
-            "category": "standard"
-        },
-    ]
+# Context dependency prefixes that now point at the first split file
+DEP_REWRITES = {
+    "context:external-libraries": "context:external-libraries-workflow",
+    "context:adding-agent": "context:adding-agent-basics",
+    "context:adding-skill": "context:adding-skill-basics",
+}
+# One anchored alternation over all prefixes, matching whole ids only
+_DEP_RE = re.compile(
+    r'^(' + '|'.join(re.escape(k) for k in sorted(DEP_REWRITES, key=len, reverse=True)) + r')'
+    r'(?=$|[^A-Za-z0-9-])'
+)
+
+# Split-file contexts: (id, name, path, description, tags)
+ENTRY_TABLE = (
+    # Task Delegation (split files)
+    ("task-delegation-basics", "Task Delegation Basics",
+     ".opencode/context/core/workflows/task-delegation-basics.md",
+     "Task delegation fundamentals and basic usage patterns",
+     ("workflows", "delegation")),
+    ("task-delegation-specialists", "Task Delegation Specialists",
+     ".opencode/context/core/workflows/task-delegation-specialists.md",
+     "Specialist subagents for task delegation workflows",
+     ("workflows", "delegation", "subagents")),
+    ("task-delegation-caching", "Task Delegation Caching",
+     ".opencode/context/core/workflows/task-delegation-caching.md",
+     "Caching strategies for task delegation workflows",
+     ("workflows", "delegation", "caching")),
+
+    # Design Iteration (split files)
+    ("design-iteration-overview", "Design Iteration Overview",
+     ".opencode/context/core/workflows/design-iteration-overview.md",
+     "Overview of the design iteration workflow process",
+     ("workflows", "design", "iteration")),
+    ("design-iteration-plan-file", "Design Iteration Plan File",
+     ".opencode/context/core/workflows/design-iteration-plan-file.md",
+     "Structure and format for design iteration plan files",
+     ("workflows", "design", "planning")),
+    ("design-iteration-plan-iterations", "Design Iteration Plan Iterations",
+     ".opencode/context/core/workflows/design-iteration-plan-iterations.md",
+     "Planning iterations in the design workflow",
+     ("workflows", "design", "planning")),
+    ("design-iteration-stage-layout", "Design Iteration Stage - Layout",
+     ".opencode/context/core/workflows/design-iteration-stage-layout.md",
+     "Layout stage guidelines for design iteration",
+     ("workflows", "design", "layout")),
+    ("design-iteration-stage-theme", "Design Iteration Stage - Theme",
+     ".opencode/context/core/workflows/design-iteration-stage-theme.md",
+     "Theme stage guidelines for design iteration",
+     ("workflows", "design", "theme")),
+    ("design-iteration-stage-implementation", "Design Iteration Stage - Implementation",
+     ".opencode/context/core/workflows/design-iteration-stage-implementation.md",
+     "Implementation stage guidelines for design iteration",
+     ("workflows", "design", "implementation")),
+    ("design-iteration-stage-animation", "Design Iteration Stage - Animation",
+     ".opencode/context/core/workflows/design-iteration-stage-animation.md",
+     "Animation stage guidelines for design iteration",
+     ("workflows", "design", "animation")),
+    ("design-iteration-visual-content", "Design Iteration Visual Content",
+     ".opencode/context/core/workflows/design-iteration-visual-content.md",
+     "Visual content guidelines for design iteration",
+     ("workflows", "design", "visual")),
+    ("design-iteration-best-practices", "Design Iteration Best Practices",
+     ".opencode/context/core/workflows/design-iteration-best-practices.md",
+     "Best practices for design iteration workflows",
+     ("workflows", "design", "best-practices")),
+
+    # External Libraries (split files)
+    ("external-libraries-workflow", "External Libraries Workflow",
+     ".opencode/context/core/workflows/external-libraries-workflow.md",
+     "Workflow for managing external library dependencies",
+     ("workflows", "external", "libraries")),
+    ("external-libraries-scenarios", "External Libraries Scenarios",
+     ".opencode/context/core/workflows/external-libraries-scenarios.md",
+     "Common scenarios for external library integration",
+     ("workflows", "external", "libraries", "scenarios")),
+    ("external-libraries-faq", "External Libraries FAQ",
+     ".opencode/context/core/workflows/external-libraries-faq.md",
+     "Frequently asked questions about external libraries",
+     ("workflows", "external", "libraries", "faq")),
+
+    # Adding Agent (split files)
+    ("adding-agent-basics", "Adding Agent - Basics",
+     ".opencode/context/openagents-repo/guides/adding-agent-basics.md",
+     "Basic guide for adding new agents",
+     ("guides", "agents", "basics")),
+    ("adding-agent-testing", "Adding Agent - Testing",
+     ".opencode/context/openagents-repo/guides/adding-agent-testing.md",
+     "Testing guide for new agents",
+     ("guides", "agents", "testing")),
+
+    # Adding Skill (split files)
+    ("adding-skill-basics", "Adding Skill - Basics",
+     ".opencode/context/openagents-repo/guides/adding-skill-basics.md",
+     "Basic guide for adding new skills",
+     ("guides", "skills", "basics")),
+    ("adding-skill-implementation", "Adding Skill - Implementation",
+     ".opencode/context/openagents-repo/guides/adding-skill-implementation.md",
+     "Implementation guide for new skills",
+     ("guides", "skills", "implementation")),
+    ("adding-skill-example", "Adding Skill - Example",
+     ".opencode/context/openagents-repo/guides/adding-skill-example.md",
+     "Example of adding a new skill",
+     ("guides", "skills", "examples")),
+
+    # Navigation Design (split files)
+    ("navigation-design-basics", "Navigation Design Basics",
+     ".opencode/context/core/context-system/guides/navigation-design-basics.md",
+     "Basics of designing navigation files",
+     ("context-system", "navigation", "design")),
+    ("navigation-templates", "Navigation Templates",
+     ".opencode/context/core/context-system/guides/navigation-templates.md",
+     "Templates for navigation files",
+     ("context-system", "navigation", "templates")),
+
+    # Animation Patterns (split files)
+    ("animation-basics", "Animation Basics",
+     ".opencode/context/ui/web/animation-basics.md",
+     "Basic animation patterns and guidelines",
+     ("ui", "web", "animation")),
+    ("animation-advanced", "Animation Advanced",
+     ".opencode/context/ui/web/animation-advanced.md",
+     "Advanced animation patterns and techniques",
+     ("ui", "web", "animation")),
+    ("animation-components", "Animation Components",
+     ".opencode/context/ui/web/animation-components.md",
+     "Component-specific animation patterns",
+     ("ui", "web", "animation", "components")),
+    ("animation-forms", "Animation Forms",
+     ".opencode/context/ui/web/animation-forms.md",
+     "Animation patterns for forms",
+     ("ui", "web", "animation", "forms")),
+    ("animation-chat", "Animation Chat",
+     ".opencode/context/ui/web/animation-chat.md",
+     "Animation patterns for chat interfaces",
+     ("ui", "web", "animation", "chat")),
+    ("animation-loading", "Animation Loading",
+     ".opencode/context/ui/web/animation-loading.md",
+     "Loading animation patterns",
+     ("ui", "web", "animation", "loading")),
+)
+
+class Reporter:
+    """Collects status messages and writes them to stdout in one call"""
+
+    def __init__(self, quiet=False):
+        self.quiet = quiet
+        self.msgs = []
+
+    def info(self, msg):
+        if not self.quiet:
+            self.msgs.append(msg)
+
+    def warn(self, msg):
+        self.msgs.append(msg)
+
+    def flush(self):
+        if self.msgs:
+            sys.stdout.write("\n".join(self.msgs) + "\n")
+            sys.stdout.flush()
+            self.msgs = []
+
+def _parse(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity and integers wider than 64 bits are json-only
+            pass
+    return json.loads(data)
+
+def load_registry(data=None):
+    """Parse registry.json, or its bytes if the caller already read them"""
+    if data is None:
+        data = REGISTRY_FILE.read_bytes()
+    return _parse(data)
+
+def _has_float(obj):
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            return True
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+def dump_registry(registry):
+    """Serialize the registry to bytes exactly as json.dump(indent=2) does"""
+    # orjson is only used where its output is byte-identical: it formats
+    # floats differently (1e16 vs 1e+16), never escapes non-ASCII and
+    # rejects integers wider than 64 bits
+    if orjson is not None and not _has_float(registry):
+        try:
+            data = orjson.dumps(registry, option=orjson.OPT_INDENT_2)
+        except (orjson.JSONEncodeError, TypeError):
+            data = None
+        if data is not None and data.isascii():
+            return data
+    return json.dumps(registry, indent=2).encode('ascii')
+
+def save_registry(registry, reporter, loaded=None):
+    """Write the registry unless it encodes to the bytes originally loaded"""
+    data = dump_registry(registry)
+    if data == loaded:
+        reporter.info("✓ No changes; registry not rewritten")
+        return
+    REGISTRY_FILE.write_bytes(data)
+    reporter.info(f"✓ Registry saved to {REGISTRY_FILE}")
+
+def index_components(registry, category):
+    """Map component id -> component for one registry category"""
+    return {c['id']: c for c in registry['components'].get(category, [])}
+
+@dataclass(slots=True)
+class Entry:
+    """A split-file context entry; converted to a dict only when added.
+
+    Field order is the registry key order, so asdict() serializes the same
+    way the hand-written dicts did.
+    """
+    id: str
+    name: str
+    type: str = field(default="context", kw_only=True)
+    path: str
+    description: str
+    tags: list[str]
+    dependencies: list[str] = field(default_factory=list)
+    category: str = "standard"
+
+def _iter_entries(rows=ENTRY_TABLE):
+    """Yield Entry objects for ENTRY_TABLE rows"""
+    for id_, name, path, description, tags in rows:
+        yield Entry(id_, name, path, description, list(tags))
+
+def load_scan_cache():
+    """Load trusted {dir: [mtime_ns, names]} listings from the last run.
+
+    As with git's racy-index check, a listing is trusted only if its
+    directory mtime is strictly older than the cache file's own mtime (its
+    write time, on the same filesystem clock) minus MTIME_RESOLUTION_NS.
+    Otherwise a file created in the same timestamp tick, after the scan,
+    would leave the directory mtime unchanged and go unnoticed.
+    """
+    try:
+        written_ns = SCAN_CACHE_FILE.stat().st_mtime_ns
+        cache = json.loads(SCAN_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    cutoff = written_ns - MTIME_RESOLUTION_NS
+    return {
+        rel_dir: entry for rel_dir, entry in cache.items()
+        if _valid_cache_entry(entry) and entry[0] < cutoff
+    }
+
+def _valid_cache_entry(entry):
+    """True for a well-formed [mtime_ns, [name, ...]] entry; others are rescanned"""
+    return (
+        isinstance(entry, list) and len(entry) == 2
+        and isinstance(entry[0], int) and isinstance(entry[1], list)
+        and all(isinstance(name, str) for name in entry[1])
+    )
+
+def save_scan_cache(cache):
+    # The cache is disposable: a read-only or locked checkout just loses it
+    try:
+        SCAN_CACHE_FILE.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n")
+    except OSError:
+        pass
+
+def _scan_dir(rel_dir, cached):
+    """List a repo-relative directory, reusing `cached` if still current.
+
+    Returns (names, cache_entry); cache_entry is [mtime_ns, names] or None
+    when the directory is missing or unreadable. Adding, removing or renaming a file
+    bumps the directory mtime, which invalidates the cached listing.
+    Only reads shared state, so it is safe to run from worker threads.
+    """
+    abs_dir = os.path.join(REPO_ROOT, rel_dir)
+    try:
+        mtime_ns = os.stat(abs_dir).st_mtime_ns
+        if cached and cached[0] == mtime_ns:
+            return set(cached[1]), cached
+        with os.scandir(abs_dir) as it:
+            names = {e.name for e in it}
+    except OSError:
+        # Missing, not a directory or unreadable: every entry is reported
+        # missing, as Path.exists() did
+        return set(), None
+    return names, [mtime_ns, sorted(names)]
+
+def _scan_dirs(rel_dirs, scan_cache):
+    """Scan directories concurrently (I/O bound), updating scan_cache"""
+    rel_dirs = sorted(rel_dirs)
+    if not rel_dirs:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(rel_dirs))) as ex:
+        results = list(ex.map(lambda d: _scan_dir(d, scan_cache.get(d)), rel_dirs))
     
-    # Verify files exist before adding
-    verified_entries = []
-    for entry in new_entries:
-        file_path = REPO_ROOT / entry['path']
-        if file_path.exists():
-            verified_entries.append(entry)
+    dir_cache = {}
+    for rel_dir, (names, cache_entry) in zip(rel_dirs, results):
+        dir_cache[rel_dir] = names
+        if cache_entry is None:
+            scan_cache.pop(rel_dir, None)
+        else:
+            scan_cache[rel_dir] = cache_entry
+    return dir_cache
+
+def rebuild_contexts(registry, reporter):
+    """Drop dead context entries and add split-file entries that exist on disk"""
+    # Single pass: filter dead ids and collect the surviving ids together.
+    # Entries are kept as a list because a few distinct files share an id.
+    contexts = []
+    existing_ids = set()
+    removed = 0
+    for c in registry['components'].get('contexts', []):
+        if c['id'] in DEAD_ENTRIES:
+            removed += 1
         else:
-            print(f"⚠ File doesn't exist: {entry['path']}")
+            contexts.append(c)
+            existing_ids.add(c['id'])
+    
+    removed_msg = f"contexts: {removed} entries" if removed else "None"
+    reporter.info(f"✓ Removed dead references: {removed_msg}")
     
-    # Add to registry
-    if 'contexts' not in registry['components']:
-        registry['components']['contexts'] = []
+    # Only entries missing from the registry need building or checking
+    missing = [row for row in ENTRY_TABLE if row[0] not in existing_ids]
     
-    existing_ids = {c['id'] for c in registry['components']['contexts']}
+    # Verify files exist before adding (one concurrent scan per parent dir,
+    # skipped entirely for directories unchanged since the last run)
+    scan_cache = load_scan_cache() if missing else {}
+    original_scan_cache = dict(scan_cache)
+    dir_cache = _scan_dirs({row[2].rpartition('/')[0] for row in missing}, scan_cache)
     added = 0
-    for entry in verified_entries:
-        if entry['id'] not in existing_ids:
-            registry['components']['contexts'].append(entry)
+    for entry in _iter_entries(missing):
+        parent, _, name = entry.path.rpartition('/')
+        if name in dir_cache[parent]:
+            contexts.append(asdict(entry))
             added += 1
+        else:
+            reporter.warn(f"⚠ File doesn't exist: {entry.path}")
+    
+    if scan_cache != original_scan_cache:
+        save_scan_cache(scan_cache)
     
-    print(f"✓ Added {added} new split-file entries")
+    registry['components']['contexts'] = contexts
+    reporter.info(f"✓ Added {added} new split-file entries")
     return registry
 
-def update_dependencies(registry):
+def _rewrite_dep(dep):
+    """Rewrite a dependency whose id exactly matches a DEP_REWRITES prefix"""
+    m = _DEP_RE.match(dep)
+    return DEP_REWRITES[m.group(1)] + dep[m.end():] if m else dep
+
+def update_dependencies(registry, reporter):
     """Update dependencies that referenced old split files"""
+    agents_by_id = index_components(registry, 'agents')
+    
     # Update OpenCoder dependencies
-    for agent in registry['components'].get('agents', []):
-        if agent['id'] == 'opencoder':
-            # Replace workflows-delegation with task-delegation-basics
-            agent['dependencies'] = [
-                dep.replace('context:workflows-delegation', 'context:task-delegation-basics')
-                for dep in agent['dependencies']
-            ]
-            print(f"✓ Updated dependencies for agent: {agent['id']}")
+    agent = agents_by_id.get('opencoder')
+    if agent is not None:
+        # Replace workflows-delegation with task-delegation-basics
+        agent['dependencies'] = [
+            dep.replace('context:workflows-delegation', 'context:task-delegation-basics')
+            for dep in agent['dependencies']
+        ]
+        reporter.info(f"✓ Updated dependencies for agent: {agent['id']}")
     
     # Update context dependencies
     for ctx in registry['components'].get('contexts', []):
         if 'dependencies' in ctx:
-            # Replace external-libraries with external-libraries-workflow
-            ctx['dependencies'] = [
-                dep.replace('context:external-libraries', 'context:external-libraries-workflow')
-                for dep in ctx['dependencies']
-            ]
-            # Replace adding-agent with adding-agent-basics
-            ctx['dependencies'] = [
-                dep.replace('context:adding-agent', 'context:adding-agent-basics')
-                for dep in ctx['dependencies']
-            ]
-            # Replace adding-skill with adding-skill-basics  
-            ctx['dependencies'] = [
-                dep.replace('context:adding-skill', 'context:adding-skill-basics')
-                for dep in ctx['dependencies']
-            ]
+            ctx['dependencies'] = [_rewrite_dep(dep) for dep in ctx['dependencies']]
     
-    print(f"✓ Updated dependencies referencing split files")
+    reporter.info("✓ Updated dependencies referencing split files")
     return registry
 
 def main():
-    print("=" * 60)
-    print("Registry Fix Script")
-    print("=" * 60)
-    
-    # Load registry
-    registry = load_registry()
-    print(f"✓ Loaded registry with {len(registry['components'].get('contexts', []))} contexts")
+    parser = argparse.ArgumentParser(description="Fix dead references and add orphaned files to registry.json")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only report warnings")
+    args = parser.parse_args()
     
-    # Fix steps
-    registry = remove_dead_references(registry)
-    registry = add_split_file_entries(registry)
-    registry = update_dependencies(registry)
-    
-    # Save registry
-    save_registry(registry)
-    
-    # Validate
-    context_count = len(registry['components'].get('contexts', []))
-    print(f"\n✓ Registry now has {context_count} context entries")
-    print("\nNext: Run validation to check results")
-    print("  bun run scripts/registry/validate-registry.ts")
+    reporter = Reporter(quiet=args.quiet)
+    try:
+        reporter.info("=" * 60)
+        reporter.info("Registry Fix Script")
+        reporter.info("=" * 60)
+        
+        # Load registry
+        loaded = REGISTRY_FILE.read_bytes()
+        registry = load_registry(loaded)
+        reporter.info(f"✓ Loaded registry with {len(registry['components'].get('contexts', []))} contexts")
+        
+        # Fix steps
+        registry = rebuild_contexts(registry, reporter)
+        registry = update_dependencies(registry, reporter)
+        
+        # Save registry
+        save_registry(registry, reporter, loaded)
+        
+        # Validate
+        context_count = len(registry['components'].get('contexts', []))
+        reporter.info(f"\n✓ Registry now has {context_count} context entries")
+        reporter.info("\nNext: Run validation to check results")
+        reporter.info("  bun run scripts/registry/validate-registry.ts")
+    finally:
+        reporter.flush()
 
 if __name__ == "__main__":
     main()